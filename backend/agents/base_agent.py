@@ -54,7 +54,7 @@ class BaseAgent(ABC):
         Returns:
             (output, metadata)
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             self.logger.info(f"🚀 {self.name} agent starting...")
@@ -63,7 +63,7 @@ class BaseAgent(ABC):
             output, metadata = await self.execute(request, context)
             
             # Calculate execution time
-            execution_time_ms = int((time.time() - start_time) * 1000)
+            execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             metadata["execution_time_ms"] = execution_time_ms
             
             # Ensure required metadata fields
@@ -83,7 +83,7 @@ class BaseAgent(ABC):
             return output, metadata
         
         except Exception as e:
-            execution_time_ms = int((time.time() - start_time) * 1000)
+            execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             self.logger.error(f"✗ {self.name} failed after {execution_time_ms}ms: {e}")
             
             # Return error metadata
@@ -3,6 +3,7 @@ BudgetAgent - UPDATED to use meal_plan from DiningAgent
 Calculates budget breakdown and validates against total budget
 """
 
+import re
 from typing import Dict, Optional, List
 from backend.agents.base_agent import BaseAgent
 from backend.models.schemas import (
@@ -10,6 +11,16 @@ from backend.models.schemas import (
     HotelOutput, DiningOutput, FlightOutput, DestinationOutput
 )
 
+# Cost-cutting advice for a budget category that dominates an over-budget trip
+_CATEGORY_SUGGESTIONS = {
+    "accommodation": "Consider a more budget-friendly hotel or shorter stay",
+    "flights": "Look for cheaper flights or alternative dates",
+    "food": "Try more budget-friendly restaurants or reduce meals",
+    "activities": "Prioritize free/low-cost attractions",
+}
+
+_DIGITS_RE = re.compile(r'\d+')
+
 
 class BudgetAgent(BaseAgent):
     """Agent that calculates budget breakdown and provides recommendations"""
@@ -255,10 +266,9 @@ class BudgetAgent(BaseAgent):
                     cost = 0
                 else:
                     # Extract number from string
-                    import re
-                    numbers = re.findall(r'\d+', cost_str)
-                    if numbers:
-                        cost = float(numbers[0])
+                    match = _DIGITS_RE.search(cost_str)
+                    if match:
+                        cost = float(match.group())
                     else:
                         cost = 20000  # Default estimate
             
@@ -327,14 +337,7 @@ class BudgetAgent(BaseAgent):
         for category, cost in sorted_costs[:2]:
             percentage = (cost / total_cost) * 100
             if percentage > 25:
-                if category == "accommodation":
-                    suggestions.append("Consider a more budget-friendly hotel or shorter stay")
-                elif category == "flights":
-                    suggestions.append("Look for cheaper flights or alternative dates")
-                elif category == "food":
-                    suggestions.append("Try more budget-friendly restaurants or reduce meals")
-                elif category == "activities":
-                    suggestions.append("Prioritize free/low-cost attractions")
+                suggestions.append(_CATEGORY_SUGGESTIONS[category])
         
         return suggestions
     
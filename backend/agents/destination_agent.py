@@ -7,7 +7,7 @@ import os
 from datetime import datetime
 from dotenv import load_dotenv
 # import google.generativeai as genai  <-- REMOVED
-from backend.utils.llm_client import GeminiClient  # <-- ADDED
+from backend.utils.llm_client import get_llm_client, strip_code_fences
 from backend.models.schemas import (
     TripRequest, 
     DestinationOutput, 
@@ -29,7 +29,7 @@ class DestinationAgent(BaseAgent):
         
         # Initialize Gemini
         try:
-            self.model = GeminiClient()
+            self.model = get_llm_client()
             self.llm_available = True
             print("✅ Gemini initialized for DestinationAgent")
         except Exception as e:
@@ -117,15 +117,11 @@ IMPORTANT:
 Return ONLY the JSON, nothing else."""
 
         try:
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
             text = response.text.strip()
             
             # Remove markdown code blocks if present
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-                text = text.strip()
+            text = strip_code_fences(text)
             
             data = json.loads(text)
             
@@ -33,8 +33,8 @@ class DiningAgent(BaseAgent):
         self.llm_enabled = False
         try:
             # import google.generativeai as genai <-- REMOVED
-            from backend.utils.llm_client import GeminiClient # <-- ADDED
-            self.llm_model = GeminiClient()
+            from backend.utils.llm_client import get_llm_client
+            self.llm_model = get_llm_client()
             self.llm_enabled = True
             logger.info("✅ LLM fallback enabled for restaurant generation (Gemini)")
         except Exception as e:
@@ -205,9 +205,7 @@ class DiningAgent(BaseAgent):
             return output, metadata
         
         except Exception as e:
-            logger.error(f"❌ DiningAgent failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"❌ DiningAgent failed: {e}")
             raise
     
     # ========================================
@@ -271,6 +269,7 @@ class DiningAgent(BaseAgent):
             logger.info("🧠 [Tier 2] Generating restaurants via LLM...")
             
             import json
+            from backend.utils.llm_client import strip_code_fences
             
             destination = request.destination
             
@@ -303,15 +302,11 @@ Price guidelines for {destination}:
 - Budget ($): Rp 30,000 - 75,000
 - Mid-range ($$): Rp 100,000 - 200,000"""
             
-            response = self.llm_model.generate_content(prompt)
+            response = await self.llm_model.generate_content_async(prompt)
             text = response.text.strip()
             
             # Remove markdown if present
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-                text = text.strip()
+            text = strip_code_fences(text)
             
             restaurants_data = json.loads(text)
             
@@ -387,15 +387,12 @@ Jakarta → Village: {{"has_airport": false}}
 
 Your JSON:"""
 
-            response = self.amadeus_client.llm_model.generate_content(prompt)
+            response = await self.amadeus_client.llm_model.generate_content_async(prompt)
             
             import json
+            from backend.utils.llm_client import strip_code_fences
             text = response.text.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-                text = text.strip()
+            text = strip_code_fences(text)
             
             data = json.loads(text)
             
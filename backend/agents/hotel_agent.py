@@ -9,7 +9,7 @@ from typing import List, Dict, Optional, Tuple
 from dotenv import load_dotenv
 from dotenv import load_dotenv
 # import google.generativeai as genai <-- REMOVED
-from backend.utils.llm_client import GeminiClient # <-- ADDED
+from backend.utils.llm_client import get_llm_client, strip_code_fences
 from backend.models.schemas import (
     TripRequest, 
     HotelOutput, 
@@ -29,7 +29,7 @@ class HotelAgent(BaseAgent):
         
         # Initialize Gemini
         try:
-            self.model = GeminiClient()
+            self.model = get_llm_client()
             self.llm_available = True
             print("✅ Gemini initialized for HotelAgent")
         except Exception as e:
@@ -67,14 +67,10 @@ Return ONLY valid JSON array (no markdown):
 Provide realistic prices in IDR. Rating 0.0-5.0. Return ONLY the JSON array."""
 
         try:
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
             text = response.text.strip()
             
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-                text = text.strip()
+            text = strip_code_fences(text)
             
             hotels = json.loads(text)
             print(f"✅ LLM generated {len(hotels)} hotels for {destination}")
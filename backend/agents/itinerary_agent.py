@@ -4,14 +4,59 @@ Generates day-by-day trip itinerary with specific restaurant assignments
 and awareness of travel times.
 """
 
-from typing import Dict, Optional, List
-from datetime import datetime, timedelta
+import re
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
+from datetime import datetime, time as dt_time, timedelta
+from operator import attrgetter
+from types import MappingProxyType
 from backend.agents.base_agent import BaseAgent
 from backend.models.schemas import (
     TripRequest, ItineraryOutput, DayItinerary, Activity,
     DestinationOutput, DiningOutput, HotelOutput, FlightOutput
 )
 
+# Generic tips attached to every generated itinerary
+_DEFAULT_TIPS = ("Wear comfortable shoes", "Stay hydrated", "Keep valuables secure")
+
+# Static part of the metadata returned with a fallback itinerary
+_FALLBACK_METADATA = MappingProxyType({
+    "data_source": "error",
+    "confidence": 0.0,  # 0-1 range
+})
+
+# Entrance-fee parsing ("Free", "Rp 50000", ...)
+_FREE_RE = re.compile(r'free', re.IGNORECASE)
+_COST_DIGITS_RE = re.compile(r'\d+')
+
+# Fixed daily schedule slots
+_DEFAULT_ARRIVAL_TIME = dt_time(10, 0)
+_MORNING_TIME = dt_time(9, 0)
+_LUNCH_TIME = dt_time(12, 30)
+_AFTERNOON_TIME = dt_time(14, 30)
+_CHECKIN_TIME = dt_time(15, 0)
+_DINNER_TIME = dt_time(19, 0)
+
+# Indexed by date.weekday(); avoids a strftime("%A") call per day
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Sort key for a day's activities ("HH:MM" strings order chronologically)
+_activity_time = attrgetter("time")
+
+
+@lru_cache(maxsize=256)
+def _parse_cost_str(cost: str) -> float:
+    """Parse a textual fee; destinations reuse a handful of distinct strings"""
+    if _FREE_RE.search(cost):
+        return 0.0
+    
+    # Extract first number
+    match = _COST_DIGITS_RE.search(cost)
+    if match:
+        return float(match.group(0))
+    
+    return 0.0
+
 
 class ItineraryAgent(BaseAgent):
     """Agent that generates detailed day-by-day itinerary"""
@@ -57,9 +102,11 @@ class ItineraryAgent(BaseAgent):
                 "Missing destination data",
                 "error"
             )
+            # Nothing to schedule without attractions; skip the day loop
+            return self._create_fallback_output(request, warnings)
         
-        # Generate day-by-day itinerary
-        days = self._generate_daily_itineraries(
+        # Generate day-by-day itinerary (activity count is accumulated per day)
+        days, total_activities = self._generate_daily_itineraries(
             request,
             destination_output,
             dining_output,
@@ -68,9 +115,6 @@ class ItineraryAgent(BaseAgent):
             warnings
         )
         
-        # Calculate total activities
-        total_activities = sum(len(day.activities) for day in days)
-        
         # Generate overview
         overview = f"A {request.duration_days}-day trip to {request.destination} with {total_activities} planned activities."
         
@@ -79,14 +123,14 @@ class ItineraryAgent(BaseAgent):
             days=days,
             total_activities=total_activities,
             overview=overview,
-            tips=["Wear comfortable shoes", "Stay hydrated", "Keep valuables secure"],
+            tips=list(_DEFAULT_TIPS),
             warnings=warnings
         )
         
         # Calculate confidence (0-1 range, not 0-100)
         confidence_score = self._calculate_confidence(
             data_source="seed",
-            data_quality_score=100 if destination_output else 50
+            data_quality_score=100
         )
         # Convert from 0-100 to 0-1
         confidence = confidence_score / 100.0
@@ -110,18 +154,35 @@ class ItineraryAgent(BaseAgent):
         hotel_output: Optional[HotelOutput],
         flight_output: Optional[FlightOutput],  # <--- NEW Argument
         warnings: list
-    ) -> List[DayItinerary]:
+    ) -> Tuple[List[DayItinerary], int]:
         """
         Generate itinerary for each day of the trip
         Respects flight arrival times to avoid scheduling activities during travel.
+        Activities and days are built with model_construct() since every
+        input already comes from validated agent outputs.
+
+        Returns:
+            (days, total_activities)
         """
         
         days = []
+        total_activities = 0
         
         # Get resources
         attractions = destination_output.attractions if destination_output else []
+        num_attractions = len(attractions)
         hotel = hotel_output.recommended_hotel if hotel_output else None
         meal_plan = dining_output.meal_plan if dining_output else []
+        # Index by day (reversed so the first plan for a day wins, as before)
+        meal_by_day = {m.day: m for m in reversed(meal_plan)}
+        
+        # Loop-invariant fields, bound once instead of re-read every day
+        hotel_name = hotel.name if hotel else "Hotel"
+        hotel_address = (hotel.address or "Hotel") if hotel else "Hotel"
+        hotel_type = hotel.type if hotel else None
+        explore_title = f"Explore {request.destination}"
+        travelers = request.travelers
+        pace = request.preferences.pace
         
         # NEW: Determine arrival time logic
         arrival_dt = None
@@ -136,39 +197,46 @@ class ItineraryAgent(BaseAgent):
                 start_tracking_activities = False # Don't start activities until we land
         else:
             # If no flight info, assume we arrive at 10 AM on start date
-            arrival_dt = datetime.combine(request.start_date, datetime.min.time().replace(hour=10))
+            arrival_dt = datetime.combine(request.start_date, _DEFAULT_ARRIVAL_TIME)
         
         self.logger.info(
             f"📅 Generating itinerary with {len(meal_plan)} days of meal plans"
         )
         
         # Generate itinerary loop
-        current_date = request.start_date
-        day_num = 1
+        start_date = request.start_date
+        num_days = request.duration_days
         attraction_index = 0
         has_checked_in = False
         
-        while current_date <= request.end_date:
+        for i in range(num_days):
+            day_num = i + 1
+            current_date = start_date + timedelta(days=i)
+            is_last_day = i == num_days - 1
+            
             # Get meal plan for this day
-            day_meals = next((m for m in meal_plan if m.day == day_num), None)
+            day_meals = meal_by_day.get(day_num)
+            lunch_restaurant = day_meals.lunch if day_meals else None
+            dinner_restaurant = day_meals.dinner if day_meals else None
+            breakfast_notes = day_meals.breakfast_notes if day_meals else None
             
             activities = []
             daily_cost = 0.0
             
             # --- DEFINE SLOT TIMES ---
-            morning_slot = datetime.combine(current_date, datetime.min.time().replace(hour=9, minute=0))
-            lunch_slot = datetime.combine(current_date, datetime.min.time().replace(hour=12, minute=30))
-            afternoon_slot = datetime.combine(current_date, datetime.min.time().replace(hour=14, minute=30))
-            dinner_slot = datetime.combine(current_date, datetime.min.time().replace(hour=19, minute=0))
+            morning_slot = datetime.combine(current_date, _MORNING_TIME)
+            lunch_slot = datetime.combine(current_date, _LUNCH_TIME)
+            afternoon_slot = datetime.combine(current_date, _AFTERNOON_TIME)
+            dinner_slot = datetime.combine(current_date, _DINNER_TIME)
             
             # --- 1. MORNING ACTIVITY (09:00) ---
             if morning_slot >= arrival_dt:
-                if attraction_index < len(attractions):
+                if attraction_index < num_attractions:
                     morning_activity = self._create_activity(
                         time="09:00",
                         activity_type="attraction",
                         attraction=attractions[attraction_index],
-                        request=request
+                        travelers=travelers
                     )
                     activities.append(morning_activity)
                     daily_cost += morning_activity.estimated_cost
@@ -176,25 +244,25 @@ class ItineraryAgent(BaseAgent):
             
             # --- 2. LUNCH (12:30) ---
             if lunch_slot >= arrival_dt:
-                if day_meals and day_meals.lunch:
+                if lunch_restaurant:
                     lunch_activity = self._create_meal_activity(
                         time="12:30",
                         meal_type="lunch",
-                        restaurant=day_meals.lunch,
-                        request=request
+                        restaurant=lunch_restaurant,
+                        travelers=travelers
                     )
                     activities.append(lunch_activity)
                     daily_cost += lunch_activity.estimated_cost
-                elif day_meals and day_meals.breakfast_notes and not activities:
+                elif breakfast_notes and not activities:
                     # Late breakfast/brunch if it's the first activity
-                    breakfast_activity = Activity(
+                    breakfast_activity = Activity.model_construct(
                         time="10:00",
                         name="Breakfast/Brunch",
                         type="dining",
-                        location=hotel.name if hotel else "Hotel",
+                        location=hotel_name,
                         description="Start the day with a meal",
                         duration_hours=1.0,
-                        estimated_cost=0
+                        estimated_cost=0.0
                     )
                     activities.append(breakfast_activity)
 
@@ -203,7 +271,7 @@ class ItineraryAgent(BaseAgent):
             # If we arrive BEFORE 15:00, check in at 15:00.
             # If we arrive AFTER 15:00, check in 1 hour after landing.
             if not has_checked_in and hotel:
-                standard_checkin = datetime.combine(current_date, datetime.min.time().replace(hour=15, minute=0))
+                standard_checkin = datetime.combine(current_date, _CHECKIN_TIME)
                 
                 # Check if we can check in today (arrival must be before or somewhat after checkin time on this day)
                 # Ensure we strictly check in AFTER arrival
@@ -227,29 +295,28 @@ class ItineraryAgent(BaseAgent):
                     has_checked_in = True
                 
                 if has_checked_in and checkin_time:
-                    checkin_activity = Activity(
+                    checkin_activity = Activity.model_construct(
                         time=checkin_time,
-                        name=f"Check-in: {hotel.name}",
+                        name=f"Check-in: {hotel_name}",
                         type="hotel",
-                        location=hotel.address or "Hotel",
-                        description=f"Check-in to {hotel.type} accommodation",
+                        location=hotel_address,
+                        description=f"Check-in to {hotel_type} accommodation",
                         duration_hours=0.5,
-                        estimated_cost=0
+                        estimated_cost=0.0
                     )
-                    # Insert in correct order based on time string
+                    # Put in time order by the sort at the end of the day
                     activities.append(checkin_activity)
-                    activities.sort(key=lambda x: x.time)
 
             # --- 4. AFTERNOON ACTIVITY (14:30) ---
             if afternoon_slot >= arrival_dt:
                 # Only schedule afternoon if not conflicting with a late checkin
                 # Simple logic: just add it
-                if attraction_index < len(attractions):
+                if attraction_index < num_attractions:
                     afternoon_activity = self._create_activity(
                         time="14:30",
                         activity_type="attraction",
                         attraction=attractions[attraction_index],
-                        request=request
+                        travelers=travelers
                     )
                     # Avoid duplicate time slots if checkin is also 14:30/15:00, but keeping it simple
                     activities.append(afternoon_activity)
@@ -258,12 +325,12 @@ class ItineraryAgent(BaseAgent):
             
             # --- 5. DINNER (19:00) ---
             if dinner_slot >= arrival_dt:
-                if day_meals and day_meals.dinner:
+                if dinner_restaurant:
                     dinner_activity = self._create_meal_activity(
                         time="19:00",
                         meal_type="dinner",
-                        restaurant=day_meals.dinner,
-                        request=request
+                        restaurant=dinner_restaurant,
+                        travelers=travelers
                     )
                     activities.append(dinner_activity)
                     daily_cost += dinner_activity.estimated_cost
@@ -271,42 +338,47 @@ class ItineraryAgent(BaseAgent):
             # Handle "In Transit" day
             if not activities and arrival_dt.date() == current_date:
                 # We arrive today but too late for activities
-                activities.append(Activity(
+                activities.append(Activity.model_construct(
                     time=arrival_dt.strftime("%H:%M"),
                     name="Arrival & Transit",
                     type="travel",
                     location="Airport",
                     description="Arrive at destination and transfer to accommodation",
                     duration_hours=2.0,
-                    estimated_cost=0
+                    estimated_cost=0.0
                 ))
             elif not activities and arrival_dt.date() > current_date:
                  # Still flying (e.g. Day 1 of a long haul)
-                 activities.append(Activity(
+                 activities.append(Activity.model_construct(
                     time="All Day",
                     name="En Route to Destination",
                     type="travel",
                     location="In Flight",
                     description="Travel day",
                     duration_hours=24.0,
-                    estimated_cost=0
+                    estimated_cost=0.0
                 ))
 
-            # Re-sort activities by time just in case
-            activities.sort(key=lambda x: x.time if x.time != "All Day" else "00:00")
+            # Sort activities by time. "All Day" / transit entries are only
+            # added to an otherwise empty day, so a plain time key is enough.
+            activities.sort(key=_activity_time)
 
             # Create day object
-            title = f"Day {day_num}: Explore {request.destination}"
             if day_num == 1 or (arrival_dt.date() == current_date):
-                title = f"Day {day_num}: Arrival & Settle In"
-            elif current_date == request.end_date:
-                title = f"Day {day_num}: Departure"
+                title_suffix = "Arrival & Settle In"
+            elif is_last_day:
+                title_suffix = "Departure"
             elif arrival_dt.date() > current_date:
-                title = f"Day {day_num}: Traveling"
+                title_suffix = "Traveling"
+            else:
+                title_suffix = explore_title
+            title = f"Day {day_num}: {title_suffix}"
 
-            notes = self._generate_day_notes(day_num, current_date, request, len(activities))
+            notes = self._generate_day_notes(
+                day_num, _WEEKDAY_NAMES[current_date.weekday()], pace, len(activities)
+            )
             
-            day = DayItinerary(
+            day = DayItinerary.model_construct(
                 day_number=day_num,
                 date=current_date,
                 title=title,
@@ -316,29 +388,27 @@ class ItineraryAgent(BaseAgent):
             )
             
             days.append(day)
-            
-            # Move to next day
-            current_date += timedelta(days=1)
-            day_num += 1
+            total_activities += len(activities)
         
-        return days
+        return days, total_activities
     
     def _create_activity(
         self,
         time: str,
         activity_type: str,
         attraction: any,
-        request: TripRequest
+        travelers: int
     ) -> Activity:
         """Create activity from attraction"""
         
-        cost = self._parse_cost(attraction.entrance_fee) * request.travelers
+        cost = self._parse_cost(attraction.entrance_fee) * travelers
+        name = attraction.name
         
-        return Activity(
+        return Activity.model_construct(
             time=time,
             type=activity_type,
-            name=attraction.name,
-            location=attraction.address or attraction.name,
+            name=name,
+            location=attraction.address or name,
             description=attraction.description,
             duration_hours=attraction.estimated_duration_hours,
             estimated_cost=cost
@@ -349,17 +419,23 @@ class ItineraryAgent(BaseAgent):
         time: str,
         meal_type: str,
         restaurant: any,
-        request: TripRequest
+        travelers: int
     ) -> Activity:
         """Create restaurant activity from meal_plan"""
         
-        cost = restaurant.average_cost_per_person * request.travelers
+        cost = restaurant.average_cost_per_person * travelers
         
-        description = f"{restaurant.cuisine}"
-        if restaurant.specialties:
-            description += f" - Try: {', '.join(restaurant.specialties[:2])}"
+        # Mention up to two specialties without slicing/joining a new list
+        cuisine = restaurant.cuisine
+        specialties = restaurant.specialties
+        if not specialties:
+            description = cuisine
+        elif len(specialties) == 1:
+            description = f"{cuisine} - Try: {specialties[0]}"
+        else:
+            description = f"{cuisine} - Try: {specialties[0]}, {specialties[1]}"
         
-        return Activity(
+        return Activity.model_construct(
             time=time,
             type="dining",
             name=f"{meal_type.title()}: {restaurant.name}",
@@ -378,31 +454,19 @@ class ItineraryAgent(BaseAgent):
             return float(cost)
         
         if isinstance(cost, str):
-            cost_lower = cost.lower()
-            
-            if "free" in cost_lower:
-                return 0.0
-            
-            # Extract number
-            import re
-            numbers = re.findall(r'\d+', cost)
-            if numbers:
-                return float(numbers[0])
+            return _parse_cost_str(cost)
         
         return 0.0
     
     def _generate_day_notes(
         self,
         day_num: int,
-        date: datetime,
-        request: TripRequest,
+        day_name: str,
+        pace: str,
         activity_count: int
     ) -> str:
         """Generate notes for the day"""
         
-        day_name = date.strftime("%A")
-        pace = request.preferences.pace
-        
         notes = []
         
         if activity_count == 0:
@@ -429,13 +493,10 @@ class ItineraryAgent(BaseAgent):
             total_activities=0,
             overview="Unable to generate itinerary due to missing data",
             tips=[],
-            warnings=warnings
+            warnings=[w["message"] for w in warnings]
         )
         
-        metadata = {
-            "data_source": "error",
-            "confidence": 0.0,  # 0-1 range
-            "warnings": warnings
-        }
+        # Fresh dict per call: BaseAgent.run() adds timing fields to it
+        metadata = {**_FALLBACK_METADATA, "warnings": warnings}
         
         return output, metadata
\ No newline at end of file
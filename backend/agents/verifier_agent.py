@@ -3,6 +3,7 @@ Verifier Agent - Validates and checks trip plan quality
 FIXED: Removed retriever parameter (not used), updated execute() to use context
 """
 import logging
+import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 from backend.models.schemas import (
@@ -20,6 +21,85 @@ from backend.agents.base_agent import BaseAgent
 
 logger = logging.getLogger(f"agent.Verifier")
 
+# ValidationIssue severities
+_SEVERITY_ERROR = "error"
+_SEVERITY_WARNING = "warning"
+
+# Outputs below this confidence are reported as low-quality data
+_LOW_CONFIDENCE_THRESHOLD = 0.5
+
+# Plan checks, in report order: (applies, severity, component, message, suggestion).
+# Each predicate receives the checks dict built in execute(); a callable
+# message is formatted from the same dict.
+_VALIDATION_RULES = (
+    (
+        lambda c: not c["destination"] or not c["destination"].destination,
+        _SEVERITY_ERROR, "destination",
+        "No destination information available",
+        "Ensure destination agent completed successfully",
+    ),
+    (
+        lambda c: c["destination"] and c["destination"].destination and not c["destination"].attractions,
+        _SEVERITY_WARNING, "destination",
+        "No attractions found for destination",
+        "Consider adding popular attractions manually",
+    ),
+    (
+        lambda c: not c["hotel"] or not c["hotel"].hotels,
+        _SEVERITY_ERROR, "accommodation",
+        "No hotel options available",
+        "Check hotel availability for the destination and dates",
+    ),
+    (
+        lambda c: c["hotel"] and c["hotel"].hotels and not c["hotel"].recommended_hotel,
+        _SEVERITY_WARNING, "accommodation",
+        "No recommended hotel selected",
+        "Review available hotels and select one",
+    ),
+    (
+        lambda c: not c["dining"] or not c["dining"].restaurants,
+        _SEVERITY_WARNING, "dining",
+        "No restaurant recommendations available",
+        "Search for local restaurants manually",
+    ),
+    (
+        lambda c: not c["flight"] or not c["flight"].outbound_flights,
+        _SEVERITY_ERROR, "transportation",
+        "No outbound flight options available",
+        "Check flight availability for the route and dates",
+    ),
+    (
+        lambda c: c["flight"] and not c["flight"].return_flights,
+        _SEVERITY_ERROR, "transportation",
+        "No return flight options available",
+        "Check return flight availability",
+    ),
+    (
+        lambda c: not c["budget"],
+        _SEVERITY_WARNING, "budget",
+        "Budget analysis not available",
+        "Calculate budget breakdown manually",
+    ),
+    (
+        lambda c: c["budget"] and not c["budget"].is_within_budget,
+        _SEVERITY_ERROR, "budget",
+        lambda c: f"Budget exceeded by Rp {c['budget'].breakdown.total - c['request'].budget:,.0f}",
+        "Consider reducing accommodation costs or trip duration",
+    ),
+    (
+        lambda c: not c["itinerary"] or not c["itinerary"].days,
+        _SEVERITY_WARNING, "itinerary",
+        "No itinerary generated",
+        "Create a daily schedule manually",
+    ),
+    (
+        lambda c: c["itinerary"] and c["itinerary"].days and c["empty_days"],
+        _SEVERITY_WARNING, "itinerary",
+        lambda c: f"{c['empty_days']} day(s) have no planned activities",
+        "Add activities to fill empty days",
+    ),
+)
+
 
 class VerifierAgent(BaseAgent):
     """Agent responsible for verifying trip plan quality and completeness"""
@@ -44,144 +124,79 @@ class VerifierAgent(BaseAgent):
             (VerificationOutput, metadata)
         """
         self.logger.info("🚀 Verifier agent starting...")
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         # Extract outputs from context
-        destination_output: Optional[DestinationOutput] = context.get('destination_output') if context else None
-        hotel_output: Optional[HotelOutput] = context.get('hotel_output') if context else None
-        dining_output: Optional[DiningOutput] = context.get('dining_output') if context else None
-        flight_output: Optional[FlightOutput] = context.get('flight_output') if context else None
-        budget_output: Optional[BudgetOutput] = context.get('budget_output') if context else None
-        itinerary_output: Optional[ItineraryOutput] = context.get('itinerary_output') if context else None
+        get = (context or {}).get
+        destination_output: Optional[DestinationOutput] = get('destination_output')
+        hotel_output: Optional[HotelOutput] = get('hotel_output')
+        dining_output: Optional[DiningOutput] = get('dining_output')
+        flight_output: Optional[FlightOutput] = get('flight_output')
+        budget_output: Optional[BudgetOutput] = get('budget_output')
+        itinerary_output: Optional[ItineraryOutput] = get('itinerary_output')
         
         try:
-            issues: List[ValidationIssue] = []
-            
-            # Check destination
-            if not destination_output or not destination_output.destination:
-                issues.append(ValidationIssue(
-                    severity="error",
-                    component="destination",
-                    message="No destination information available",
-                    suggestion="Ensure destination agent completed successfully"
-                ))
-            elif not destination_output.attractions:
-                issues.append(ValidationIssue(
-                    severity="warning",
-                    component="destination",
-                    message="No attractions found for destination",
-                    suggestion="Consider adding popular attractions manually"
-                ))
-            
-            # Check hotels
-            if not hotel_output or not hotel_output.hotels:
-                issues.append(ValidationIssue(
-                    severity="error",
-                    component="accommodation",
-                    message="No hotel options available",
-                    suggestion="Check hotel availability for the destination and dates"
-                ))
-            elif not hotel_output.recommended_hotel:
-                issues.append(ValidationIssue(
-                    severity="warning",
-                    component="accommodation",
-                    message="No recommended hotel selected",
-                    suggestion="Review available hotels and select one"
-                ))
-            
-            # Check dining
-            if not dining_output or not dining_output.restaurants:
-                issues.append(ValidationIssue(
-                    severity="warning",
-                    component="dining",
-                    message="No restaurant recommendations available",
-                    suggestion="Search for local restaurants manually"
-                ))
-            
-            # Check flights
-            if not flight_output or not flight_output.outbound_flights:
-                issues.append(ValidationIssue(
-                    severity="error",
-                    component="transportation",
-                    message="No outbound flight options available",
-                    suggestion="Check flight availability for the route and dates"
-                ))
-            if flight_output and not flight_output.return_flights:
-                issues.append(ValidationIssue(
-                    severity="error",
-                    component="transportation",
-                    message="No return flight options available",
-                    suggestion="Check return flight availability"
-                ))
-            
-            # Check budget
-            if not budget_output:
-                issues.append(ValidationIssue(
-                    severity="warning",
-                    component="budget",
-                    message="Budget analysis not available",
-                    suggestion="Calculate budget breakdown manually"
-                ))
-            elif not budget_output.is_within_budget:
-                # Calculate over amount
-                over_amount = budget_output.breakdown.total - request.budget
-                issues.append(ValidationIssue(
-                    severity="error",
-                    component="budget",
-                    message=f"Budget exceeded by Rp {over_amount:,.0f}",
-                    suggestion="Consider reducing accommodation costs or trip duration"
-                ))
+            checks = {
+                "request": request,
+                "destination": destination_output,
+                "hotel": hotel_output,
+                "dining": dining_output,
+                "flight": flight_output,
+                "budget": budget_output,
+                "itinerary": itinerary_output,
+                "empty_days": (
+                    sum(1 for day in itinerary_output.days if not day.activities)
+                    if itinerary_output else 0
+                ),
+            }
             
-            # Check itinerary
-            if not itinerary_output or not itinerary_output.days:
-                issues.append(ValidationIssue(
-                    severity="warning",
-                    component="itinerary",
-                    message="No itinerary generated",
-                    suggestion="Create a daily schedule manually"
-                ))
-            elif itinerary_output:
-                # Check for empty days
-                empty_days = [day for day in itinerary_output.days if not day.activities]
-                if empty_days:
-                    issues.append(ValidationIssue(
-                        severity="warning",
-                        component="itinerary",
-                        message=f"{len(empty_days)} day(s) have no planned activities",
-                        suggestion="Add activities to fill empty days"
-                    ))
+            issues: List[ValidationIssue] = [
+                ValidationIssue(
+                    severity=severity,
+                    component=component,
+                    message=message(checks) if callable(message) else message,
+                    suggestion=suggestion
+                )
+                for applies, severity, component, message, suggestion in _VALIDATION_RULES
+                if applies(checks)
+            ]
             
             # Check data quality across all components
-            low_confidence_components = []
-            if destination_output and destination_output.confidence < 0.5:
-                low_confidence_components.append("destination")
-            if hotel_output and hotel_output.confidence < 0.5:
-                low_confidence_components.append("accommodation")
-            if dining_output and dining_output.confidence < 0.5:
-                low_confidence_components.append("dining")
-            if flight_output and flight_output.confidence < 0.5:
-                low_confidence_components.append("flights")
+            low_confidence_components = [
+                component
+                for component, component_output in (
+                    ("destination", destination_output),
+                    ("accommodation", hotel_output),
+                    ("dining", dining_output),
+                    ("flights", flight_output),
+                )
+                if component_output and component_output.confidence < _LOW_CONFIDENCE_THRESHOLD
+            ]
             
             if low_confidence_components:
                 issues.append(ValidationIssue(
-                    severity="warning",
+                    severity=_SEVERITY_WARNING,
                     component="data_quality",
                     message=f"Low confidence data in: {', '.join(low_confidence_components)}",
                     suggestion="Verify information from multiple sources"
                 ))
             
+            # Split issues by severity in a single pass
+            error_messages: List[str] = []
+            warning_messages: List[str] = []
+            for issue in issues:
+                if issue.severity == _SEVERITY_ERROR:
+                    error_messages.append(issue.message)
+                elif issue.severity == _SEVERITY_WARNING:
+                    warning_messages.append(issue.message)
+            error_count = len(error_messages)
+            warning_count = len(warning_messages)
+            
             # Determine if plan is valid
-            critical_issues = [i for i in issues if i.severity == "error"]
-            is_valid = len(critical_issues) == 0
+            is_valid = error_count == 0
             
             # Calculate overall quality score (0-100)
-            quality_score = 100.0
-            for issue in issues:
-                if issue.severity == "error":
-                    quality_score -= 20.0
-                elif issue.severity == "warning":
-                    quality_score -= 5.0
-            quality_score = max(0.0, min(100.0, quality_score))
+            quality_score = max(0.0, 100.0 - 20.0 * error_count - 5.0 * warning_count)
             
             # Calculate confidence based on completeness
             components_present = sum([
@@ -207,21 +222,28 @@ class VerifierAgent(BaseAgent):
                 else:
                     summary = f"Trip plan is valid with {len(issues)} minor warning(s)"
             else:
-                summary = f"Found {len(critical_issues)} critical issue(s) that must be resolved"
+                summary = f"Found {error_count} critical issue(s) that must be resolved"
             
-            duration = (datetime.now() - start_time).total_seconds() * 1000
+            duration = (time.perf_counter() - start_time) * 1000
             self.logger.info(
                 f"✓ Verifier completed in {duration:.0f}ms "
                 f"(valid: {is_valid}, issues: {len(issues)}, confidence: {confidence*100:.0f}%)"
             )
             
+            execution_time_ms = int(duration)
+            
             # Create output
             output = VerificationOutput(
                 is_valid=is_valid,
                 issues=issues,
                 quality_score=quality_score,
                 summary=summary,
-                metadata=self._create_metadata("seed", duration),
+                metadata={
+                    "agent": self.name,
+                    "data_source": "seed",
+                    "execution_time_ms": execution_time_ms,
+                    "timestamp": datetime.now().isoformat()
+                },
                 data_source="seed",
                 confidence=confidence
             )
@@ -230,23 +252,14 @@ class VerifierAgent(BaseAgent):
             metadata = {
                 "data_source": "seed",
                 "confidence": confidence,
-                "warnings": [issue.message for issue in issues if issue.severity == "warning"],
-                "errors": [issue.message for issue in issues if issue.severity == "error"],
-                "execution_time_ms": int(duration)
+                "warnings": warning_messages,
+                "errors": error_messages,
+                "execution_time_ms": execution_time_ms
             }
             
             return output, metadata
             
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds() * 1000
+            duration = (time.perf_counter() - start_time) * 1000
             self.logger.error(f"✗ Verifier failed after {duration:.0f}ms: {e}")
-            raise
-    
-    def _create_metadata(self, data_source: str, duration: float) -> dict:
-        """Create metadata dictionary"""
-        return {
-            "agent": self.name,
-            "data_source": data_source,
-            "execution_time_ms": int(duration),
-            "timestamp": datetime.now().isoformat()
-        }
\ No newline at end of file
+            raise
\ No newline at end of file
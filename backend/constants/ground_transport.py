@@ -3,7 +3,10 @@ Ground Transport Database - Hardcoded for TOP Indonesian routes
 Covers ~80% of domestic travel use cases
 """
 
-from typing import Dict, Optional, List
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List
 
 # Format: (origin, destination) -> transport options
 GROUND_TRANSPORT_DB: Dict[tuple, Dict] = {
@@ -155,6 +158,80 @@ GROUND_TRANSPORT_DB: Dict[tuple, Dict] = {
 }
 
 
+def _build_route_lookup() -> Dict[tuple, Dict]:
+    """
+    Index every route under both (origin, destination) and the reverse pair.
+    Options dicts are shared with GROUND_TRANSPORT_DB, not copied; an
+    explicit entry always wins over the reverse of another route.
+    """
+    lookup = dict(GROUND_TRANSPORT_DB)
+    for (origin, destination), options in GROUND_TRANSPORT_DB.items():
+        lookup.setdefault((destination, origin), options)
+    return lookup
+
+
+def _pick_cheapest(options: Dict) -> Optional[Dict]:
+    """Summarize the lowest cost_per_person option of a route"""
+    
+    if not options:
+        return None
+    
+    # min() keeps the first of equally cheap options, like a strict < scan
+    transport_type, details = min(
+        options.items(),
+        key=lambda item: item[1].get('cost_per_person', float('inf'))
+    )
+    cost = details.get('cost_per_person', float('inf'))
+    if cost == float('inf'):
+        return None
+    
+    return {
+        'transport_type': transport_type,
+        'cost_per_person': cost,
+        'duration_hours': details.get('duration_hours'),
+        'name': details.get('name'),
+        'operator': details.get('operator')
+    }
+
+
+# Read-only views derived from GROUND_TRANSPORT_DB at import time
+_ROUTE_LOOKUP: Mapping[tuple, Dict] = MappingProxyType(_build_route_lookup())
+_CHEAPEST_BY_ROUTE: Mapping[tuple, Optional[Dict]] = MappingProxyType({
+    key: _pick_cheapest(options) for key, options in _ROUTE_LOOKUP.items()
+})
+_MIN_DURATION_BY_ROUTE: Mapping[tuple, float] = MappingProxyType({
+    key: min(
+        (details.get('duration_hours', 999) for details in options.values()),
+        default=float('inf')
+    )
+    for key, options in _ROUTE_LOOKUP.items()
+})
+
+# City names exactly as they appear in the DB (already normalized)
+_CANONICAL_CITIES = frozenset(
+    sys.intern(city) for route in GROUND_TRANSPORT_DB for city in route
+)
+
+
+# Case-insensitive spelling -> canonical DB spelling
+_CITY_BY_FOLDED_NAME = {city.casefold(): city for city in _CANONICAL_CITIES}
+
+
+def _normalize_city(name: str) -> str:
+    """Normalize a city name, skipping the work for names already canonical"""
+    if name in _CANONICAL_CITIES:
+        return name
+    stripped = name.strip()
+    # Known cities resolve through the folded map; title() only for unknowns
+    return _CITY_BY_FOLDED_NAME.get(stripped.casefold()) or stripped.title()
+
+
+@lru_cache(maxsize=256)
+def _route_key(origin: str, destination: str) -> tuple:
+    """Build the normalized lookup key for a route (memoized per raw pair)"""
+    return (_normalize_city(origin), _normalize_city(destination))
+
+
 def get_ground_transport(origin: str, destination: str) -> Optional[Dict]:
     """
     Get ground transport options between two cities
@@ -167,21 +244,9 @@ def get_ground_transport(origin: str, destination: str) -> Optional[Dict]:
         Dict with transport options or None if not available
     """
     
-    # Normalize city names
-    origin_norm = origin.strip().title()
-    dest_norm = destination.strip().title()
-    
-    # Try direct lookup
-    key = (origin_norm, dest_norm)
-    if key in GROUND_TRANSPORT_DB:
-        return GROUND_TRANSPORT_DB[key]
-    
-    # Try reverse (some routes are bidirectional)
-    reverse_key = (dest_norm, origin_norm)
-    if reverse_key in GROUND_TRANSPORT_DB:
-        return GROUND_TRANSPORT_DB[reverse_key]
-    
-    return None
+    # Routes are indexed in both directions
+    key = _route_key(origin, destination)
+    return _ROUTE_LOOKUP.get(key)
 
 
 def get_cheapest_option(origin: str, destination: str) -> Optional[Dict]:
@@ -192,26 +257,11 @@ def get_cheapest_option(origin: str, destination: str) -> Optional[Dict]:
         Dict with transport_type, cost, duration, name
     """
     
-    options = get_ground_transport(origin, destination)
-    if not options:
-        return None
-    
-    cheapest = None
-    min_cost = float('inf')
-    
-    for transport_type, details in options.items():
-        cost = details.get('cost_per_person', float('inf'))
-        if cost < min_cost:
-            min_cost = cost
-            cheapest = {
-                'transport_type': transport_type,
-                'cost_per_person': cost,
-                'duration_hours': details.get('duration_hours'),
-                'name': details.get('name'),
-                'operator': details.get('operator')
-            }
+    key = _route_key(origin, destination)
+    cheapest = _CHEAPEST_BY_ROUTE.get(key)
     
-    return cheapest
+    # Hand out a copy so callers can't alter the shared table
+    return dict(cheapest) if cheapest else None
 
 
 def is_ground_transport_viable(origin: str, destination: str, max_hours: float = 12.0) -> bool:
@@ -227,12 +277,6 @@ def is_ground_transport_viable(origin: str, destination: str, max_hours: float =
         True if viable option exists
     """
     
-    options = get_ground_transport(origin, destination)
-    if not options:
-        return False
-    
-    for details in options.values():
-        if details.get('duration_hours', 999) <= max_hours:
-            return True
-    
-    return False
\ No newline at end of file
+    key = _route_key(origin, destination)
+    min_duration = _MIN_DURATION_BY_ROUTE.get(key)
+    return min_duration is not None and min_duration <= max_hours
\ No newline at end of file
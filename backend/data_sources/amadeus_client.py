@@ -10,6 +10,7 @@ COMPLETE FIX:
 """
 
 import os
+import re
 import logging
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date, timedelta
@@ -17,6 +18,71 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 logger = logging.getLogger(__name__)
 
+# ISO 8601 duration parts, e.g. "PT2H35M"
+_DURATION_HOURS_RE = re.compile(r'(\d+)H')
+_DURATION_MINUTES_RE = re.compile(r'(\d+)M')
+
+# Airline codes to full names
+_AIRLINE_NAMES = {
+    'GA': 'Garuda Indonesia', 'SQ': 'Singapore Airlines',
+    'QZ': 'AirAsia Indonesia', 'ID': 'Batik Air',
+    'JT': 'Lion Air', 'QG': 'Citilink',
+    'MH': 'Malaysia Airlines', 'TG': 'Thai Airways',
+    'CX': 'Cathay Pacific', 'NH': 'ANA',
+    'JL': 'Japan Airlines', 'KE': 'Korean Air',
+    'EK': 'Emirates', 'QR': 'Qatar Airways',
+    'AF': 'Air France', 'BA': 'British Airways',
+    'LH': 'Lufthansa', 'UA': 'United Airlines',
+    'AA': 'American Airlines', 'DL': 'Delta Air Lines'
+}
+
+# Static fallback map for common airports
+_AIRPORT_CODES = {
+    # Indonesia - Major
+    'jakarta': 'CGK', 'bali': 'DPS', 'denpasar': 'DPS',
+    'surabaya': 'SUB', 'yogyakarta': 'JOG', 'medan': 'KNO',
+    'makassar': 'UPG', 'lombok': 'LOP', 'bandung': 'BDO',
+    'semarang': 'SRG',
+
+    # Indonesia - Secondary
+    'malang': 'MLG', 'solo': 'SOC', 'surakarta': 'SOC',
+    'balikpapan': 'BPN', 'banjarmasin': 'BDJ',
+    'manado': 'MDC', 'palembang': 'PLM',
+    'pekanbaru': 'PKU', 'pontianak': 'PNK',
+    'batam': 'BTH', 'padang': 'PDG',
+    'kupang': 'KOE', 'ambon': 'AMQ',
+    'jayapura': 'DJJ', 'kendari': 'KDI',
+    'mataram': 'AMI', 'tarakan': 'TRK',
+
+    # Southeast Asia
+    'singapore': 'SIN', 'kuala lumpur': 'KUL',
+    'bangkok': 'BKK', 'manila': 'MNL',
+    'ho chi minh': 'SGN', 'hanoi': 'HAN',
+    'phnom penh': 'PNH', 'vientiane': 'VTE',
+    'yangon': 'RGN',
+
+    # East Asia
+    'tokyo': 'NRT', 'seoul': 'ICN',
+    'hong kong': 'HKG', 'taipei': 'TPE',
+    'beijing': 'PEK', 'shanghai': 'PVG',
+
+    # Oceania
+    'sydney': 'SYD', 'melbourne': 'MEL',
+    'brisbane': 'BNE', 'auckland': 'AKL',
+
+    # Europe
+    'paris': 'CDG', 'london': 'LHR',
+    'amsterdam': 'AMS', 'frankfurt': 'FRA',
+
+    # Americas
+    'new york': 'JFK', 'los angeles': 'LAX',
+    'san francisco': 'SFO', 'chicago': 'ORD',
+
+    # Middle East
+    'dubai': 'DXB', 'doha': 'DOH',
+    'abu dhabi': 'AUH', 'riyadh': 'RUH'
+}
+
 # Try to import Amadeus
 try:
     from amadeus import Client, ResponseError
@@ -26,7 +92,7 @@ except ImportError:
     logger.warning("Amadeus SDK not installed")
 
 # Import Unified Gemini Client
-from backend.utils.llm_client import GeminiClient
+from backend.utils.llm_client import get_llm_client
 
 
 class DateValidationError(Exception):
@@ -77,7 +143,7 @@ class AmadeusFlightClient:
         
         # Initialize LLM (Gemini)
         try:
-            self.llm_model = GeminiClient()
+            self.llm_model = get_llm_client()
             self.llm_enabled = True
             logger.info("✅ LLM airport resolver enabled (Gemini)")
         except Exception as e:
@@ -254,9 +320,7 @@ class AmadeusFlightClient:
             return []
         
         except Exception as e:
-            logger.error(f"❌ Flight search failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"❌ Flight search failed: {e}")
             return []
     
     def _parse_flight_offer(self, offer: Dict, departure_date: date, return_date: Optional[date]) -> Optional[Dict]:
@@ -364,16 +428,14 @@ class AmadeusFlightClient:
     def _parse_duration(self, duration_str: str) -> int:
         """Parse ISO 8601 duration to minutes"""
         try:
-            import re
-            duration_str = duration_str.replace('PT', '')
             hours = 0
             minutes = 0
             
-            hour_match = re.search(r'(\d+)H', duration_str)
+            hour_match = _DURATION_HOURS_RE.search(duration_str)
             if hour_match:
                 hours = int(hour_match.group(1))
             
-            minute_match = re.search(r'(\d+)M', duration_str)
+            minute_match = _DURATION_MINUTES_RE.search(duration_str)
             if minute_match:
                 minutes = int(minute_match.group(1))
             
@@ -383,19 +445,7 @@ class AmadeusFlightClient:
     
     def _get_airline_name(self, carrier_code: str) -> str:
         """Map airline codes to full names"""
-        airline_map = {
-            'GA': 'Garuda Indonesia', 'SQ': 'Singapore Airlines',
-            'QZ': 'AirAsia Indonesia', 'ID': 'Batik Air',
-            'JT': 'Lion Air', 'QG': 'Citilink',
-            'MH': 'Malaysia Airlines', 'TG': 'Thai Airways',
-            'CX': 'Cathay Pacific', 'NH': 'ANA',
-            'JL': 'Japan Airlines', 'KE': 'Korean Air',
-            'EK': 'Emirates', 'QR': 'Qatar Airways',
-            'AF': 'Air France', 'BA': 'British Airways',
-            'LH': 'Lufthansa', 'UA': 'United Airlines',
-            'AA': 'American Airlines', 'DL': 'Delta Air Lines'
-        }
-        return airline_map.get(carrier_code, carrier_code)
+        return _AIRLINE_NAMES.get(carrier_code, carrier_code)
     
     def get_airport_code(self, city_name: str) -> Optional[str]:
         """
@@ -499,57 +549,11 @@ Your answer (ONLY the code or NONE):"""
         
         city_lower = city_name.lower().strip()
         
-        airport_map = {
-            # Indonesia - Major
-            'jakarta': 'CGK', 'bali': 'DPS', 'denpasar': 'DPS',
-            'surabaya': 'SUB', 'yogyakarta': 'JOG', 'medan': 'KNO',
-            'makassar': 'UPG', 'lombok': 'LOP', 'bandung': 'BDO',
-            'semarang': 'SRG',
-            
-            # Indonesia - Secondary
-            'malang': 'MLG', 'solo': 'SOC', 'surakarta': 'SOC',
-            'balikpapan': 'BPN', 'banjarmasin': 'BDJ',
-            'manado': 'MDC', 'palembang': 'PLM',
-            'pekanbaru': 'PKU', 'pontianak': 'PNK',
-            'batam': 'BTH', 'padang': 'PDG',
-            'kupang': 'KOE', 'ambon': 'AMQ',
-            'jayapura': 'DJJ', 'kendari': 'KDI',
-            'mataram': 'AMI', 'tarakan': 'TRK',
-            
-            # Southeast Asia
-            'singapore': 'SIN', 'kuala lumpur': 'KUL',
-            'bangkok': 'BKK', 'manila': 'MNL',
-            'ho chi minh': 'SGN', 'hanoi': 'HAN',
-            'phnom penh': 'PNH', 'vientiane': 'VTE',
-            'yangon': 'RGN',
-            
-            # East Asia
-            'tokyo': 'NRT', 'seoul': 'ICN',
-            'hong kong': 'HKG', 'taipei': 'TPE',
-            'beijing': 'PEK', 'shanghai': 'PVG',
-            
-            # Oceania
-            'sydney': 'SYD', 'melbourne': 'MEL',
-            'brisbane': 'BNE', 'auckland': 'AKL',
-            
-            # Europe
-            'paris': 'CDG', 'london': 'LHR',
-            'amsterdam': 'AMS', 'frankfurt': 'FRA',
-            
-            # Americas
-            'new york': 'JFK', 'los angeles': 'LAX',
-            'san francisco': 'SFO', 'chicago': 'ORD',
-            
-            # Middle East
-            'dubai': 'DXB', 'doha': 'DOH',
-            'abu dhabi': 'AUH', 'riyadh': 'RUH'
-        }
-        
-        code = airport_map.get(city_lower)
+        code = _AIRPORT_CODES.get(city_lower)
         if code:
             return code
         
-        for city, code in airport_map.items():
+        for city, code in _AIRPORT_CODES.items():
             if city in city_lower or city_lower in city:
                 logger.info(f"Partial match: {city_name} → {code} (matched '{city}')")
                 return code
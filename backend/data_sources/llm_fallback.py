@@ -7,7 +7,7 @@ import os
 import json
 import logging
 from typing import Optional, List, Dict, Any
-from backend.utils.llm_client import GeminiClient
+from backend.utils.llm_client import get_llm_client
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +18,7 @@ class LLMFallback:
     def __init__(self):
         """Initialize Gemini client"""
         try:
-            self.model = GeminiClient()
+            self.model = get_llm_client()
             self.enabled = True
             logger.info(f"✅ LLMFallback initialized with Gemini")
         except Exception as e:
@@ -31,7 +31,7 @@ class LLMFallback:
             return None
             
         try:
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
             if response and response.text:
                 return response.text.strip()
             return None
@@ -3,6 +3,7 @@ OpenTripMapClient - Fetches Points of Interest from OpenTripMap API
 Optional data source (free API, no key required for basic usage)
 """
 
+import asyncio
 import httpx
 import logging
 from typing import Optional, List, Dict, Any
@@ -25,12 +26,40 @@ class OpenTripMapClient:
         """
         self.api_key = api_key
         self.enabled = api_key is not None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
         
         if not self.enabled:
             logger.warning("OpenTripMap API key not provided - API features disabled")
         else:
             logger.info("OpenTripMap client initialized")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            # One pooled client keeps connections to the API warm across
+            # requests instead of redoing the TCP/TLS handshake every call.
+            # Pooled connections belong to the loop that opened them, so a
+            # new loop (e.g. a second asyncio.run) gets a fresh client.
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=20)
+            )
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+    
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -51,10 +80,9 @@ class OpenTripMapClient:
         url = f"{self.BASE_URL}/{endpoint}"
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().get(url, params=params)
+            response.raise_for_status()
+            return response.json()
         
         except httpx.HTTPStatusError as e:
             logger.error(f"OpenTripMap API error {e.response.status_code}: {e}")
@@ -214,3 +242,9 @@ def get_opentripmap_client(api_key: Optional[str] = None) -> OpenTripMapClient:
     if _opentripmap_client is None:
         _opentripmap_client = OpenTripMapClient(api_key=api_key)
     return _opentripmap_client
+
+
+async def close_opentripmap_client():
+    """Close the singleton's HTTP client if it was ever created"""
+    if _opentripmap_client is not None:
+        await _opentripmap_client.aclose()
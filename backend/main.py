@@ -36,6 +36,13 @@ async def startup_event():
     print("✅ TripCraft Lite API started successfully!")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled HTTP clients on shutdown"""
+    from backend.data_sources.opentripmap_client import close_opentripmap_client
+    await close_opentripmap_client()
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -7,7 +7,7 @@ Date: 2024
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any, Literal
+from typing import ClassVar, List, Optional, Dict, Any, Literal
 from datetime import datetime
 from enum import Enum
 
@@ -274,9 +274,21 @@ class ModificationQueue(BaseModel):
     """Queue of pending modifications"""
     modifications: List[Modification] = Field(default_factory=list)
     
-    def add(self, modification: Modification):
-        """Add modification to queue"""
+    # Pending changes allowed before apply (class constant, not a field)
+    MAX_SIZE: ClassVar[int] = 50
+    
+    def add(self, modification: Modification) -> bool:
+        """
+        Add modification to queue
+        
+        Returns False without adding anything when the queue already holds
+        MAX_SIZE modifications; callers must check the result and report
+        the rejection (e.g. QueueResult(success=False)).
+        """
+        if self.is_full():
+            return False
         self.modifications.append(modification)
+        return True
     
     def clear(self):
         """Clear all modifications"""
@@ -287,6 +299,9 @@ class ModificationQueue(BaseModel):
     
     def is_empty(self) -> bool:
         return len(self.modifications) == 0
+    
+    def is_full(self) -> bool:
+        return len(self.modifications) >= self.MAX_SIZE
 
 
 # ============================================================================
@@ -305,10 +320,20 @@ class ModificationHistory(BaseModel):
     entries: List[HistoryEntry] = Field(default_factory=list)
     current_index: int = -1
     
+    # Oldest entries (and their snapshots) are dropped past this
+    MAX_ENTRIES: ClassVar[int] = 64
+    
     def push(self, modification: Modification, plan_snapshot: Any):
         """Add entry to history"""
         # Clear any "redo" history if user made new change
-        self.entries = self.entries[:self.current_index + 1]
+        del self.entries[self.current_index + 1:]
+        
+        # Shallow copy: reassigning a top-level field on the live plan
+        # (e.g. plan.hotels = ...) no longer rewrites this entry, but nested
+        # objects such as itinerary days/activities are still shared, so
+        # in-place edits to them leak into earlier snapshots
+        if isinstance(plan_snapshot, BaseModel):
+            plan_snapshot = plan_snapshot.model_copy()
         
         entry = HistoryEntry(
             modification=modification,
@@ -316,6 +341,10 @@ class ModificationHistory(BaseModel):
         )
         self.entries.append(entry)
         self.current_index += 1
+        
+        if len(self.entries) > self.MAX_ENTRIES:
+            del self.entries[0]
+            self.current_index -= 1
     
     def can_undo(self) -> bool:
         """Check if undo is possible"""
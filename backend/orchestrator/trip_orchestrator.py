@@ -420,9 +420,8 @@ class TripOrchestrator:
             
             self.progress.complete_step("ItineraryAgent", success=True)
             
-            total_activities = sum(len(day.activities) for day in output.days)
             self.progress.add_message(
-                f"  → {len(output.days)} days, {total_activities} activities"
+                f"  → {len(output.days)} days, {output.total_activities} activities"
             )
             
             context['agent_metadata']['itinerary'] = agent_metadata
@@ -9,7 +9,16 @@ import os
 router = APIRouter(prefix="/trip", tags=["trip"])
 logger = logging.getLogger(__name__)
 
-orchestrator = TripOrchestrator()
+# Singleton instance, created on the first planning request so importing
+# the router (and PDF-only traffic) doesn't construct all seven agents
+_orchestrator = None
+
+def get_orchestrator() -> TripOrchestrator:
+    """Get singleton TripOrchestrator instance"""
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = TripOrchestrator()
+    return _orchestrator
 
 @router.post("/plan", response_model=TripPlan)
 async def plan_trip(request: TripRequest):
@@ -21,7 +30,7 @@ async def plan_trip(request: TripRequest):
         logger.info(f"Received trip request for {request.destination}")
         # Note: In a real production app, this should be a background task with polling
         # But for this demo, we await the result directly
-        trip_plan, metadata = await orchestrator.plan_trip(request)
+        trip_plan, metadata = await get_orchestrator().plan_trip(request)
         return trip_plan
     except Exception as e:
         logger.error(f"Trip planning failed: {str(e)}")
@@ -66,7 +75,5 @@ async def generate_trip_pdf(trip_plan: TripPlan):
         )
         
     except Exception as e:
-        logger.error(f"PDF generation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"PDF generation failed: {e}")
         raise HTTPException(status_code=500, detail=f"PDF generation failed: {str(e)}")
@@ -1,10 +1,20 @@
 import os
+import re
 import logging
 import google.generativeai as genai
 from typing import Optional
 
 logger = logging.getLogger("GeminiClient")
 
+# Set generation config for stability (shared by every call)
+_GENERATION_CONFIG = genai.types.GenerationConfig(
+    candidate_count=1,
+    temperature=0.7
+)
+
+# Body of a leading ```/```json markdown block (closing fence optional)
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?(.*?)(?:```|$)", re.DOTALL)
+
 class GeminiClient:
     """
     Wrapper for Google Gemini API (via google-generativeai SDK).
@@ -32,19 +42,44 @@ class GeminiClient:
             raise Exception("Gemini API key missing")
 
         try:
-            # Set generation config for stability
-            config = genai.types.GenerationConfig(
-                candidate_count=1,
-                temperature=0.7
-            )
+            response = self.model.generate_content(prompt, generation_config=_GENERATION_CONFIG)
+            return response
             
-            response = self.model.generate_content(prompt, generation_config=config)
+        except Exception as e:
+            logger.error(f"❌ Gemini generation failed: {e}")
+            raise
+
+    async def generate_content_async(self, prompt: str) -> Optional[object]:
+        """
+        Async variant of generate_content.
+        Awaits the SDK call so the event loop keeps serving other requests.
+        """
+        if not self.enabled:
+            logger.warning("Gemini is disabled (missing API key)")
+            raise Exception("Gemini API key missing")
+
+        try:
+            response = await self.model.generate_content_async(prompt, generation_config=_GENERATION_CONFIG)
             return response
             
         except Exception as e:
             logger.error(f"❌ Gemini generation failed: {e}")
             raise
 
+# Singleton
+_llm_client = None
+
 # For backward compatibility if needed, or we just update imports
-def get_llm_client():
-    return GeminiClient()
+def get_llm_client() -> GeminiClient:
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = GeminiClient()
+    return _llm_client
+
+
+def strip_code_fences(text: str) -> str:
+    """Remove a markdown code block wrapped around an LLM response, if present"""
+    match = _CODE_FENCE_RE.match(text)
+    if match:
+        return match.group(1).strip()
+    return text
@@ -0,0 +1,38 @@
+"""
+Check that ItineraryAgent falls back to an empty itinerary
+when upstream agent data is missing
+
+Run: python test_itinerary_fallback.py
+"""
+
+import asyncio
+from datetime import date
+
+from backend.agents.itinerary_agent import ItineraryAgent
+from backend.models.schemas import TripRequest
+
+
+def _make_request() -> TripRequest:
+    return TripRequest(
+        destination="Bali, Indonesia",
+        start_date=date(2026, 12, 1),
+        end_date=date(2026, 12, 4),
+        budget=10_000_000
+    )
+
+
+def test_missing_destination_returns_empty_itinerary():
+    agent = ItineraryAgent()
+
+    for context in ({}, None, {"hotel_output": None}):
+        output, metadata = asyncio.run(agent.execute(_make_request(), context))
+
+        assert output.days == []
+        assert output.total_activities == 0
+        assert output.warnings
+        assert metadata["data_source"] == "error"
+
+
+if __name__ == "__main__":
+    test_missing_destination_returns_empty_itinerary()
+    print("✅ Itinerary fallback OK")